@@ -1,6 +1,6 @@
 """
 AyxPlugin (required) has-a IncomingInterface (optional).
-Although defining IncomingInterface is optional, the interface methods are needed if an upstream tool exists.
+Since this tool accepts no incoming connection, no IncomingInterface is defined and the "ii" methods are never called.
 """
 
 import AlteryxPythonSDK as Sdk
@@ -41,7 +41,8 @@ class AyxPlugin:
         """
 
         # Getting the user-entered file name string from the GUI, and the output anchor from the XML file.
-        self.file_path = Et.fromstring(str_xml).find('browseFiles').text if 'browseFiles' in str_xml else ''
+        browse_files = Et.fromstring(str_xml).find('browseFiles')
+        self.file_path = browse_files.text if browse_files is not None and browse_files.text else ''
         self.output_anchor = self.output_anchor_mgr.get_output_anchor('Output')
 
         if not self.file_path:
@@ -86,25 +87,42 @@ class AyxPlugin:
         if self.alteryx_engine.get_init_var(self.n_tool_id, 'UpdateOnly') == 'True':
             return False
 
-        file_reader, total_records = self.get_data(self.file_path)  # Reading in the target file.
-        record_info_out = self.build_record_info_out(file_reader)  # Building out the outgoing record layout.
-        self.output_anchor.init(record_info_out)  # Lets the downstream tools know of the outgoing record metadata.
-        record_creator = record_info_out.construct_record_creator()  # Creating a new record_creator for the new data.
-
-        for record in enumerate(file_reader):
-            for field in enumerate(record[1]):
-                record_info_out[field[0]].set_from_string(record_creator, field[1])
-            # Asking for a record to push downstream
-            out_record = record_creator.finalize_record()
-            self.output_anchor.push_record(out_record, False)  # False: completed connections will automatically close.
-            # Not the best way to let the downstream tool know of this tool's progress, normally one would use a timer.
-            if record[0] % round(total_records * .30, 0) == 0:
-                self.output_anchor.update_progress(record[0]/float(total_records))
-            record_creator.reset()  # Resets the variable length data to 0 bytes (default) to prevent unexpected results.
+        # The file is closed on leaving the block, also when reading it fails part way through.
+        with open(self.file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as file_object:  # 1 MiB reads, rather than 8 KiB.
+            file_reader = self.get_data(file_object)  # Preparing the csv reader over the target file.
+            record_info_out = self.build_record_info_out(file_reader)  # Building out the outgoing record layout.
+            self.output_anchor.init(record_info_out)  # Lets the downstream tools know of the outgoing record metadata.
+            record_creator = record_info_out.construct_record_creator()  # Creating a new record_creator for the new data.
+            fields = [record_info_out[index] for index in range(record_info_out.num_fields)]
+
+            # Progress is based on bytes read rather than a row count, so the file only has to be read once.
+            total_bytes = os.path.getsize(self.file_path)
+            next_progress_bytes = 0
+            total_records = 0
+
+            for record in file_reader:
+                # Values past the last header column have no field to go in, so the row can't be read as is.
+                if len(record) > len(fields):
+                    self.display_error_msg('Record ' + str(total_records + 1) + ' has more values than the header row')
+                    break
+                for field, value in zip(fields, record):
+                    field.set_from_string(record_creator, value)
+                # Asking for a record to push downstream
+                out_record = record_creator.finalize_record()
+                self.output_anchor.push_record(out_record, False)  # False: completed connections will automatically close.
+                total_records += 1
+                # Not the best way to let the downstream tool know of this tool's progress, normally one would use a timer.
+                # tell() costs a system call, so the position is only checked every 1024 records.
+                if total_records % 1024 == 0:
+                    bytes_read = file_object.buffer.tell()
+                    if bytes_read >= next_progress_bytes:
+                        self.output_anchor.update_progress(bytes_read / float(total_bytes))
+                        next_progress_bytes = bytes_read + total_bytes * .30
+                record_creator.reset()  # Resets the variable length data to 0 bytes (default) to prevent unexpected results.
 
         self.alteryx_engine.output_message(self.n_tool_id, Sdk.EngineMessageType.info, self.xmsg(str(total_records)) + ' records were read from ' + self.file_path)
         self.output_anchor.close()  # Close outgoing connections.
-        return True
+        return self.is_initialized  # False if the file couldn't be read in full.
 
     def pi_close(self, b_has_errors: bool):
         """
@@ -122,24 +140,17 @@ class AyxPlugin:
         :return: False if the string literal entered for the file extension is not csv, otherwise True.
         """
 
-        file_extension = os.path.splitext(file_path)[1]
-        if file_extension.lower() == '.csv':
-            return True
-        return False
+        return file_path.lower().endswith('.csv')
 
     @staticmethod
-    def get_data(file_path: str):
+    def get_data(file_object: object):
         """
         A non-interface helper for pi_push_all_records() that prepares the csv file reader.
-        :param file_path: The file path entered by the user.
-        :return: The name for csv file reader and the number of rows coming in.
+        :param file_object: The opened target file.
+        :return: The csv file reader over file_object.
         """
 
-        file_object = open(file_path, 'r', encoding='utf-8')
-        file_reader = csv.reader(file_object)
-        total_records = sum(1 for record in file_object) - 1  # Disregard field names
-        file_object.seek(0)
-        return file_reader, total_records
+        return csv.reader(file_object)
 
     def build_record_info_out(self, file_reader: iter):
         """
@@ -173,50 +184,3 @@ class AyxPlugin:
         """
 
         return msg_string
-
-
-class IncomingInterface:
-    """
-    This optional class is returned by pi_add_incoming_connection, and it implements the incoming interface methods, to
-    be utilized by the Alteryx engine to communicate with a plugin when processing an incoming connection.
-    Prefixed with "ii", the Alteryx engine will expect the below four interface methods to be defined.
-    """
-
-    def __init__(self, parent: object):
-        """
-        Constructor for IncomingInterface.
-        :param parent: AyxPlugin
-        """
-
-        pass
-
-    def ii_init(self, record_info_in: object) -> bool:
-        """
-        Called to report changes of the incoming connection's record metadata to the Alteryx engine.
-        :param record_info_in: A RecordInfo object for the incoming connection's fields.
-        """
-
-        pass
-
-    def ii_push_record(self, in_record: object) -> bool:
-        """
-        Called when an input record is being sent to the plugin.
-        :param in_record: The data for the incoming record.
-        """
-
-        pass
-
-    def ii_update_progress(self, d_percent: float):
-        """
-        Called by the upstream tool to report what percentage of records have been pushed.
-        :param d_percent: Value between 0.0 and 1.0.
-        """
-
-        pass
-
-    def ii_close(self):
-        """
-        Called when the incoming connection has finished passing all of its records.
-        """
-
-        pass
@@ -41,8 +41,9 @@ class AyxPlugin:
         :param str_xml: The raw XML from the GUI.
         """
 
-        self.left_prefix = Et.fromstring(str_xml).find('LeftPrefix').text
-        self.right_prefix = Et.fromstring(str_xml).find('RightPrefix').text
+        root = Et.fromstring(str_xml)
+        self.left_prefix = root.find('LeftPrefix').text
+        self.right_prefix = root.find('RightPrefix').text
         self.output_anchor = self.output_anchor_mgr.get_output_anchor('Output')
 
     def pi_add_incoming_connection(self, str_type: str, str_name: str) -> object:
@@ -125,18 +126,11 @@ class AyxPlugin:
         :return: New names for the incoming connections.
         """
 
-        min_n_records = min(len(left_input.record_list), len(right_input.record_list))
-        max_n_records = max(len(left_input.record_list), len(right_input.record_list))
-
         # Having the shortest list be the first to output, so set_dest_to_null is applied only for the first copy,\
         # when dealing with an uneven record pair. This swap process will eventually be replaced in subsequent releases.
-        if min_n_records != max_n_records:
-            first_half_output = left_input if min_n_records == len(left_input.record_list) else right_input
-            second_half_output = right_input if first_half_output == left_input else left_input
-        else:
-            first_half_output = left_input
-            second_half_output = right_input
-        return first_half_output, second_half_output
+        if len(left_input.record_list) <= len(right_input.record_list):
+            return left_input, right_input
+        return right_input, left_input
 
     @staticmethod
     def setup_record_copier(child: object, record_info_out: object, start_index: int):
@@ -149,8 +143,9 @@ class AyxPlugin:
         """
 
         child.record_copier = Sdk.RecordCopier(record_info_out, child.record_info_in)
+        add_mapping = child.record_copier.add
         for index in range(child.record_info_in.num_fields):
-            child.record_copier.add(start_index + index, index)
+            add_mapping(start_index + index, index)
         child.record_copier.done_adding()
         return child.record_info_in.num_fields
 
@@ -174,22 +169,28 @@ class AyxPlugin:
 
         record_creator = record_info_out.construct_record_creator()  # Creating a new record_creator for the joined records.
 
-        for input_pair in it.zip_longest(first_half_output.record_list, second_half_output.record_list):
+        first_copy = first_half_output.record_copier.copy
+        second_copy = second_half_output.record_copier.copy
+        push_record = self.output_anchor.push_record
 
-            # Copying the record into the record creator. NULL values will be used to fill for the difference.
-            if input_pair[0] is not None:
-                first_half_output.record_copier.copy(record_creator, input_pair[0].finalize_record())
-            else:
-                first_half_output.record_copier.set_dest_to_null(record_creator)
-            second_half_output.record_copier.copy(record_creator, input_pair[1].finalize_record())
+        # Since first_half_output is never the longer stream, every one of its records has a partner to pair with.
+        for first_record, second_record in zip(first_half_output.record_list, second_half_output.record_list):
+            first_copy(record_creator, first_record.finalize_record())
+            second_copy(record_creator, second_record.finalize_record())
 
             # Asking for a record to push downstream, then resetting the record to prevent unexpected results.
-            output_record = record_creator.finalize_record()
-            self.output_anchor.push_record(output_record, False)
+            push_record(record_creator.finalize_record(), False)
             record_creator.reset()
 
             #TODO: The progress update to the downstream tool, based on time elapsed, should go here.
 
+        # NULL values will be used to fill for the difference, over the remaining records of the longer stream.
+        for second_record in it.islice(second_half_output.record_list, len(first_half_output.record_list), None):
+            first_half_output.record_copier.set_dest_to_null(record_creator)
+            second_copy(record_creator, second_record.finalize_record())
+            push_record(record_creator.finalize_record(), False)
+            record_creator.reset()
+
         self.output_anchor.close()  # Close outgoing connections.
 
     def process_update_input_progress(self):
@@ -256,8 +257,9 @@ class IncomingInterface:
         self.record_copier = Sdk.RecordCopier(record_info_in, record_info_in)
 
         # Map each column of the input to where we want in the output.
+        add_mapping = self.record_copier.add
         for index in range(record_info_in.num_fields):
-            self.record_copier.add(index, index)
+            add_mapping(index, index)
 
         self.record_copier.done_adding()  # A necessary step to let record copier know that field mappings are done.
         self.record_info_in = record_info_in  # For later reference.
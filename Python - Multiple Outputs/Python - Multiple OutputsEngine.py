@@ -5,6 +5,7 @@ Although defining IncomingInterface is optional, the interface methods are neede
 
 import AlteryxPythonSDK as Sdk
 import xml.etree.ElementTree as Et
+from xml.sax.saxutils import quoteattr
 
 
 class AyxPlugin:
@@ -41,7 +42,7 @@ class AyxPlugin:
         """
 
         # Getting the user-entered prefixes from the GUI, and the output anchors from the XML file.
-        self.field_selection = Et.fromstring(str_xml).find('FieldSelect').text if 'FieldSelect' in str_xml else None
+        self.field_selection = Et.fromstring(str_xml).findtext('FieldSelect') or None
         self.unique_output_anchor = self.output_anchor_mgr.get_output_anchor('Unique')
         self.dupe_output_anchor = self.output_anchor_mgr.get_output_anchor('Duplicate')
 
@@ -97,12 +98,11 @@ class AyxPlugin:
         :param order: Asc or Desc
         """
 
-        # Building the XML string to pass as an argument to pre_sort's sort info parameter.
-        root = Et.Element(element)
-        sub_element = 'Field field="{0}" order="{1}"' if order != "" else 'Field field="{0}"'
-        Et.SubElement(root, sub_element.format(subelement, order))
-        xml_string = Et.tostring(root, encoding='utf8', method='xml')
-        self.xml_sort_info += xml_string.decode('utf8').replace("<?xml version='1.0' encoding='utf8'?>\n", "")
+        # Building the XML string to pass as an argument to pre_sort's sort info parameter, with the attributes quoted.
+        field_attributes = 'field={0}'.format(quoteattr(str(subelement)))
+        if order != "":
+            field_attributes += ' order={0}'.format(quoteattr(str(order)))
+        self.xml_sort_info += '<{0}><Field {1} /></{0}>'.format(element, field_attributes)
 
     def xmsg(self, msg_string: str):
         """
@@ -134,6 +134,9 @@ class IncomingInterface:
         self.record_info_in = None
         self.record_info_out = None
         self.target_field = None
+        self.get_target_value = None
+        self.push_unique = None
+        self.push_dupe = None
         self.previous_value = None
         self.records_unique = 0
         self.records_dupe = 0
@@ -157,6 +160,11 @@ class IncomingInterface:
             self.record_info_in.get_field_num(self.parent.field_selection)
         ]
 
+        # Storing the target field's getter and both anchors' push_record for ii_push_record.
+        self.get_target_value = self.target_field.get_as_string
+        self.push_unique = self.parent.unique_output_anchor.push_record
+        self.push_dupe = self.parent.dupe_output_anchor.push_record
+
         self.record_info_out = self.record_info_in.clone()  # Creating an exact copy of record_info_in.
 
         # Initialize output anchors
@@ -173,12 +181,14 @@ class IncomingInterface:
         :return: True
         """
 
-        current_value = self.target_field.get_as_string(in_record)
+        current_value = self.get_target_value(in_record)
 
         if current_value == self.previous_value:
-            self.parent.dupe_output_anchor.push_record(in_record)
+            self.push_dupe(in_record)
+            self.records_dupe += 1
         else:
-            self.parent.unique_output_anchor.push_record(in_record)
+            self.push_unique(in_record)
+            self.records_unique += 1
 
         self.previous_value = current_value
         return True
@@ -45,11 +45,15 @@ class AyxPlugin:
         """
 
         # Getting the dataName data property from the Gui.html
-        self.column_name = Et.fromstring(str_xml).find('FieldName').text if 'FieldName' in str_xml else None
-        self.total_record_count = int(Et.fromstring(str_xml).find('EndValue').text) if 'EndValue' in str_xml else None
-        self.record_increment = int(Et.fromstring(str_xml).find('StepByValue').text) if 'StepByValue' in str_xml else None
-        self.starting_value = int(Et.fromstring(str_xml).find('StartValue').text) - self.record_increment if 'StartValue' in str_xml else None
-        field_type = Et.fromstring(str_xml).find('FieldType').text if 'FieldType' in str_xml else None
+        root = Et.fromstring(str_xml)
+        self.column_name = root.findtext('FieldName') or None  # An empty FieldName is treated the same as a missing one.
+        end_value = root.findtext('EndValue')
+        step_by_value = root.findtext('StepByValue')
+        start_value = root.findtext('StartValue')
+        self.total_record_count = int(end_value) if end_value is not None else None
+        self.record_increment = int(step_by_value) if step_by_value is not None else None
+        self.starting_value = int(start_value) - self.record_increment if start_value is not None else None
+        field_type = root.findtext('FieldType')
 
         # Valid column name checks.
         if self.column_name is None:
@@ -123,7 +127,7 @@ class AyxPlugin:
 
             loop_value = previous_inc_value + self.record_increment
             # Set the value on our new column in the record_creator helper to be the new record_count.
-            record_info_out[0].set_from_int64(record_creator, loop_value)
+            self.output_field.set_from_int64(record_creator, loop_value)
             # Pass the record downstream.
             out_record = record_creator.finalize_record()
             # Pushes record to output connection, passing False means completed connections will be automatically closed.
@@ -184,6 +188,9 @@ class IncomingInterface:
         # Custom properties
         self.record_copier = None
         self.record_creator = None
+        self.current_value = None
+        self.record_increment = None
+        self.set_output_value = None
 
     def ii_init(self, record_info_in: object) -> bool:
         """
@@ -212,15 +219,21 @@ class IncomingInterface:
         self.record_copier = Sdk.RecordCopier(record_info_out, record_info_in)
 
         # Map each column of the input to where we want in the output.
+        add_mapping = self.record_copier.add
         for index in range(record_info_in.num_fields):
             # Adding a field index mapping.
-            self.record_copier.add(index, index)
+            add_mapping(index, index)
 
         # Let record copier know that all field mappings have been added.
         self.record_copier.done_adding()
 
         # Grab the index of our new field in the record, so we don't have to do a string lookup on every push_record.
         self.parent.output_field = record_info_out[record_info_out.get_field_num(self.parent.column_name)]
+
+        # Setting up the running value, its increment and the new field's setter for ii_push_record.
+        self.current_value = self.parent.starting_value
+        self.record_increment = self.parent.record_increment
+        self.set_output_value = self.parent.output_field.set_from_int64
         return True
 
     def ii_push_record(self, in_record: object) -> bool:
@@ -234,15 +247,15 @@ class IncomingInterface:
         if not self.parent.is_initialized:
             return False
 
-        # Increment our custom starting_value variable by the selected record increment to show we have a new record.
-        self.parent.starting_value += self.parent.record_increment
+        # Increment our running value by the selected record increment to show we have a new record.
+        self.current_value += self.record_increment
 
         # Copy the data from the incoming record into the outgoing record.
         self.record_creator.reset()
         self.record_copier.copy(self.record_creator, in_record)
 
         # Sets the value of this field in the specified record_creator from an int64 value.
-        self.parent.output_field.set_from_int64(self.record_creator, self.parent.starting_value)
+        self.set_output_value(self.record_creator, self.current_value)
 
         out_record = self.record_creator.finalize_record()
 
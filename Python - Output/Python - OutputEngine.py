@@ -31,6 +31,8 @@ class AyxPlugin:
         self.str_file_path = ''
         self.is_valid = False
         self.single_input = None
+        self.output_file = None
+        self.csv_writer = None
 
     def pi_init(self, str_xml: str):
         """
@@ -87,7 +89,7 @@ class AyxPlugin:
         :param b_has_errors: Set to true to not do the final processing.
         """
 
-        pass
+        self.close_csv()  # Also releases the output file when the run ended before ii_close.
 
     def xmsg(self, msg_string: str) -> str:
         """
@@ -98,18 +100,28 @@ class AyxPlugin:
 
         return msg_string
 
-    @staticmethod
-    def write_lists_to_csv(file_path: str, field_lists: list):
+    def write_rows_to_csv(self, rows: list):
         """
         A non-interface, helper function that handles writing to csv and clearing the list elements.
-        :param file_path: The file path and file name input by user.
-        :param field_lists: The data for all fields.
+        The output file is opened on the first write, and kept open for the following chunks until close_csv().
+        :param rows: The buffered rows, each one a list of field values.
         """
 
-        with open(file_path, 'a', encoding='utf-8', newline='') as output_file:
-            csv.writer(output_file, delimiter=',').writerows(zip(*field_lists))
-        for sublist in field_lists:
-            del sublist[:]
+        if self.csv_writer is None:
+            self.output_file = open(self.str_file_path, 'a', encoding='utf-8', newline='')
+            self.csv_writer = csv.writer(self.output_file, delimiter=',')
+        self.csv_writer.writerows(rows)
+        del rows[:]
+
+    def close_csv(self):
+        """
+        A non-interface, helper function that closes the output file, if any data was written to it.
+        """
+
+        if self.output_file is not None:
+            self.output_file.close()
+            self.output_file = None
+            self.csv_writer = None
 
     @staticmethod
     def msg_str(file_path: str):
@@ -124,7 +136,7 @@ class AyxPlugin:
             msg_str = file_path + ' already exists. Enter a different path.'
         elif len(file_path) > 259:
             msg_str = 'Maximum path length is 259'
-        elif any((char in set('/;?*"<>|')) for char in file_path):
+        elif not set(file_path).isdisjoint('/;?*"<>|'):
             msg_str = 'These characters are not allowed in the filename: /;?*"<>|'
         elif len(file_path) == 0:
             msg_str = 'Enter a filename'
@@ -151,7 +163,8 @@ class IncomingInterface:
 
         # Custom members
         self.record_info_in = None
-        self.field_lists = []
+        self.field_getters = []
+        self.rows = []
         self.counter = 0
 
     def ii_init(self, record_info_in: object) -> bool:
@@ -164,9 +177,11 @@ class IncomingInterface:
 
         self.record_info_in = record_info_in  # For later reference.
 
-        # Storing the field names to use when writing data out.
-        for field in range(record_info_in.num_fields):
-            self.field_lists.append([record_info_in[field].name])
+        # Storing the field names as the first row to write out.
+        self.rows.append([record_info_in[field].name for field in range(record_info_in.num_fields)])
+
+        # Storing each field's get_as_string, to read the values in ii_push_record.
+        self.field_getters = [record_info_in[field].get_as_string for field in range(record_info_in.num_fields)]
         return True
 
     def ii_push_record(self, in_record: object) -> bool:
@@ -182,14 +197,12 @@ class IncomingInterface:
         if not self.parent.is_valid:
             return False
 
-        # Storing the string data of in_record
-        for field in range(self.record_info_in.num_fields):
-            in_value = self.record_info_in[field].get_as_string(in_record)
-            self.field_lists[field].append(in_value) if in_value is not None else self.field_lists[field].append('')
+        # Storing the string data of in_record as a row, so the chunk can be written out without transposing it.
+        self.rows.append([get_as_string(in_record) or '' for get_as_string in self.field_getters])  # NULLs are written as ''.
 
         # Writing when chunk mark is met, then resetting counter.
         if self.counter == 1000000:
-            self.parent.write_lists_to_csv(self.parent.str_file_path, self.field_lists)
+            self.parent.write_rows_to_csv(self.rows)
             self.counter = 0
         return True
 
@@ -208,9 +221,10 @@ class IncomingInterface:
         """
 
         if len(self.parent.str_file_path) > 0 and self.parent.is_valid:
-            # First element for each list will always be the field names.
-            if len(self.field_lists[0]) > 1:
-                self.parent.write_lists_to_csv(self.parent.str_file_path, self.field_lists)
+            # Only writing when records have arrived since the last chunk, the field names alone are not written out.
+            if self.counter > 0:
+                self.parent.write_rows_to_csv(self.rows)
+            self.parent.close_csv()
 
             # Outputting the link message that the file was written
             self.parent.alteryx_engine.output_message(
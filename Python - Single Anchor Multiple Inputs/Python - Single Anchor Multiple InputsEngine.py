@@ -28,6 +28,7 @@ class AyxPlugin:
         # Custom properties
         self.output_anchor = None
         self.all_inputs = []
+        self.open_input_count = 0
 
     def pi_init(self, str_xml: str):
         """
@@ -48,6 +49,7 @@ class AyxPlugin:
         """
 
         self.all_inputs.append(IncomingInterface(self))
+        self.open_input_count += 1  # Decremented as each connection closes, see check_input_complete.
         return self.all_inputs[-1]
 
     def pi_add_outgoing_connection(self, str_name: str) -> bool:
@@ -80,9 +82,11 @@ class AyxPlugin:
     def check_input_complete(self):
         """
         A non-interface helper tasked to verify end of processing for all incoming connections.
+        Called once per closing connection, so a countdown avoids rescanning every input's state.
         """
 
-        if all([self.all_inputs[an_input].input_complete for an_input in range(len(self.all_inputs))]):
+        self.open_input_count -= 1
+        if self.open_input_count == 0:
             self.process_output()
 
     def process_output(self):
@@ -90,20 +94,24 @@ class AyxPlugin:
         A non-interface helper responsible for pushing records out.
         """
 
-        self.output_anchor.init(self.all_inputs[0].record_info_in)  # Lets the downstream tools know of the outgoing record metadata.
+        # The first connection has already streamed its records in ii_push_record, so only the buffered ones remain.
+        push_record = self.output_anchor.push_record
 
         # Verifying that the first incoming connection's record layout is the same as subsequent incoming connections'
-        for an_input in self.all_inputs:
+        for an_input in self.all_inputs[1:]:
             if not self.all_inputs[0].record_info_in.equal_types(an_input.record_info_in, False):
                 self.alteryx_engine.output_message(
                     self.n_tool_id,
                     Sdk.EngineMessageType.error,
                     self.xmsg('Record layout (e.g. size, type) must be the same across all inputs.')
                 )
+                del an_input.record_list[:]  # Nothing from this input will be pushed, so release its records now.
             else:
-                for a_record in an_input.record_list:
-                    output_record = a_record.finalize_record()  # Asking for a record.
-                    self.output_anchor.push_record(output_record)
+                # Popping from the end of the reversed list releases each record as soon as it has been pushed.
+                an_input.record_list.reverse()
+                while an_input.record_list:
+                    a_record = an_input.record_list.pop()
+                    push_record(a_record.finalize_record())
 
                     # TODO: The progress update to the downstream tool, based on time elapsed, should go here.
 
@@ -126,6 +134,9 @@ class IncomingInterface:
     Prefixed with "ii", the Alteryx engine will expect the below four interface methods to be defined.
     """
 
+    # One instance per incoming connection, touched on every record, so skip the per-instance __dict__.
+    __slots__ = ('parent', 'is_streaming', 'd_progress_percentage', 'record_info_in', 'record_copier', 'record_list')
+
     def __init__(self, parent: object):
         """
         Constructor for IncomingInterface.
@@ -136,7 +147,7 @@ class IncomingInterface:
         self.parent = parent
 
         # Custom properties
-        self.input_complete = False
+        self.is_streaming = False
         self.d_progress_percentage = 0
         self.record_info_in = None
         self.record_copier = None
@@ -150,14 +161,22 @@ class IncomingInterface:
         :return: True for success, otherwise False.
         """
 
+        self.record_info_in = record_info_in  # For later reference.
+
+        # The first connection's records lead the output and set its layout, so they can stream straight through.
+        if self is self.parent.all_inputs[0]:
+            self.is_streaming = True
+            self.parent.output_anchor.init(record_info_in)  # Lets the downstream tools know of the outgoing record metadata.
+            return True
+
         self.record_copier = Sdk.RecordCopier(record_info_in, record_info_in)
 
         # Map each column of the input to where we want in the output.
+        add_mapping = self.record_copier.add
         for index in range(record_info_in.num_fields):
-            self.record_copier.add(index, index)
+            add_mapping(index, index)
 
         self.record_copier.done_adding()  # A necessary step to let record copier know that field mappings are done.
-        self.record_info_in = record_info_in  # For later reference.
         return True
 
     def ii_push_record(self, in_record: object) -> bool:
@@ -165,8 +184,12 @@ class IncomingInterface:
         Preserving the state of the incoming record data, since the reference to a record dies beyond this point.
         Called when an input record is being sent to the plugin.
         :param in_record: The data for the incoming record.
+        :return: False if there's a downstream error, otherwise True.
         """
 
+        if self.is_streaming:
+            return self.parent.output_anchor.push_record(in_record)  # Passing the record downstream as-is, no buffering needed.
+
         self.record_list.append(self.record_info_in.construct_record_creator())
         self.record_copier.copy(self.record_list[-1], in_record)
         return True
@@ -185,5 +208,4 @@ class IncomingInterface:
         Called when the incoming connection has finished passing all of its records.
         """
 
-        self.input_complete = True
         self.parent.check_input_complete()
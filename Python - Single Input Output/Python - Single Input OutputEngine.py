@@ -5,6 +5,7 @@ Although defining IncomingInterface is optional, the interface methods are neede
 
 import AlteryxPythonSDK as Sdk
 import xml.etree.ElementTree as Et
+from xml.sax.saxutils import quoteattr
 
 
 class AyxPlugin:
@@ -42,11 +43,12 @@ class AyxPlugin:
         """
 
         # Getting the user-entered selections from the GUI.
-        self.n_record_select = Et.fromstring(str_xml).find('NRecords').text if 'NRecords' in str_xml else None
-        self.do_sort = Et.fromstring(str_xml).find('DoSort').text == 'True' if 'DoSort' in str_xml else None
-        if Et.fromstring(str_xml).find('FieldSelect') is not None:
-            self.field_selection = Et.fromstring(str_xml).find('FieldSelect').text
-        order_selection = Et.fromstring(str_xml).find('OrderType').text if 'OrderType' in str_xml else None
+        root = Et.fromstring(str_xml)
+        n_records = root.findtext('NRecords')
+        self.n_record_select = int(n_records) if n_records is not None else None
+        self.do_sort = root.findtext('DoSort') == 'True'
+        self.field_selection = root.findtext('FieldSelect') or None
+        order_selection = root.findtext('OrderType')
 
         # Letting the user know of the necessary selections, if they haven't been selected.
         if self.do_sort and self.field_selection is None:
@@ -106,12 +108,11 @@ class AyxPlugin:
         :param order: Asc or Desc
         """
 
-        # Building the XML string to pass as an argument to pre_sort's sort info parameter.
-        root = Et.Element(element)
-        sub_element = 'Field field="{0}" order="{1}"' if order != "" else 'Field field="{0}"'
-        Et.SubElement(root, sub_element.format(subelement, order))
-        xml_string = Et.tostring(root, encoding='utf8', method='xml')
-        self.xml_sort_info += xml_string.decode('utf8').replace("<?xml version='1.0' encoding='utf8'?>\n", "")
+        # Building the XML string to pass as an argument to pre_sort's sort info parameter, with the attributes quoted.
+        field_attributes = 'field={0}'.format(quoteattr(str(subelement)))
+        if order != "":
+            field_attributes += ' order={0}'.format(quoteattr(str(order)))
+        self.xml_sort_info += '<{0}><Field {1} /></{0}>'.format(element, field_attributes)
 
     def xmsg(self, msg_string: str) -> str:
         """
@@ -140,7 +141,7 @@ class IncomingInterface:
         self.parent = parent
 
         # Custom properties
-        self.record_cnt = 0
+        self.records_remaining = 0
 
     def ii_init(self, record_info_in: object) -> bool:
         """
@@ -151,6 +152,7 @@ class IncomingInterface:
 
         record_info_out = record_info_in.clone()  # Since no new data is being introduced, setting the outgoing layout the same as record_info_in.
         self.parent.output_anchor.init(record_info_out)  # Lets the downstream tools know what the outgoing record metadata will look like, based on record_info_out.
+        self.records_remaining = self.parent.n_record_select  # Counted down in ii_push_record.
         return True
 
     def ii_push_record(self, in_record: object) -> bool:
@@ -158,17 +160,16 @@ class IncomingInterface:
         Responsible for pushing records out, under a count limit set by the user in n_record_select.
         Called when an input record is being sent to the plugin.
         :param in_record: The data for the incoming record.
-        :return: False if method calling limit (record_cnt) is hit.
+        :return: False if method calling limit (records_remaining) is hit.
         """
 
-        self.record_cnt += 1  # To keep track of the push record calls.
-
         # Quit calling ii_push_record going forward once n_record_select limit is reached.
-        if self.record_cnt <= int(self.parent.n_record_select):
-            self.parent.output_anchor.push_record(in_record)
-            self.parent.output_anchor.output_record_count(False)  # False: Let the Alteryx engine know of the record count
-        else:
+        if self.records_remaining <= 0:
             return False
+
+        self.records_remaining -= 1  # Counting down the records left to push.
+        self.parent.output_anchor.push_record(in_record)
+        self.parent.output_anchor.output_record_count(False)  # False: Let the Alteryx engine know of the record count
         return True
 
     def ii_update_progress(self, d_percent: float):